@@ -1,9 +1,20 @@
 import os
 import sys
+from datetime import timedelta
+from typing import NamedTuple
 
 from flask import Blueprint
 
 
+class SensorSpec(NamedTuple):
+    """Specification of a sensor this plugin ensures and collects data for."""
+
+    name: str
+    unit: str
+    event_resolution: timedelta
+    data_by_entsoe: bool  # data sourced directly by ENTSO-E or not (i.e. derived)
+
+
 HERE = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, HERE)
 DEFAULT_COUNTRY_CODE = "NL"
@@ -44,5 +55,10 @@ entsoe_data_bp = Blueprint("entsoe", __name__, cli_group="entsoe")
 entsoe_data_bp.cli.help = "ENTSO-E Data commands"
 
 
+from .utils import configure_entsoe  # noqa: E402
+
+# Pick the ENTSO-E server URL and auth token once, when the app registers us
+entsoe_data_bp.record_once(lambda setup_state: configure_entsoe(setup_state.app))
+
 from .generation import day_ahead as day_ahead_generation  # noqa: E402,F401
 from .prices import day_ahead as day_ahead_prices  # noqa: E402,F401
@@ -1,10 +1,11 @@
 from datetime import timedelta
 
-# sensor_name, unit, event_resolution, data sourced directly by ENTSO-E or not (i.e. derived)
+from .. import SensorSpec
+
 generation_sensors = (
-    ("Scheduled generation", "MW", timedelta(minutes=15), True),
-    ("Solar", "MW", timedelta(hours=1), True),
-    ("Wind Onshore", "MW", timedelta(hours=1), True),
-    ("Wind Offshore", "MW", timedelta(hours=1), True),
-    ("CO₂ intensity", "kg/MWh", timedelta(minutes=15), False),
+    SensorSpec("Scheduled generation", "MW", timedelta(minutes=15), True),
+    SensorSpec("Solar", "MW", timedelta(hours=1), True),
+    SensorSpec("Wind Onshore", "MW", timedelta(hours=1), True),
+    SensorSpec("Wind Offshore", "MW", timedelta(hours=1), True),
+    SensorSpec("CO₂ intensity", "kg/MWh", timedelta(minutes=15), False),
 )
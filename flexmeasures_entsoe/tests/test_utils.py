@@ -1,8 +1,8 @@
-import pytz
 import pytest
 import pandas as pd
 import click
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
 from flexmeasures_entsoe.utils import (
     abort_if_data_incomplete,
@@ -40,7 +40,7 @@ def test_parse_from_and_to_dates():
     2. 'None' defaults to tomorrow (start of day) -> day after tomorrow.
     """
     tz_str = "UTC"
-    tz = pytz.timezone(tz_str)
+    tz = ZoneInfo(tz_str)
     now = datetime.now(tz)
     today = datetime(now.year, now.month, now.day, tzinfo=tz)
 
@@ -52,7 +52,7 @@ def test_parse_from_and_to_dates():
         from_date=input_start, until_date=input_end, country_timezone=tz_str
     )
 
-    assert s.tzinfo.zone == tz.zone
+    assert s.tzinfo.key == tz.key
     assert (e - s) == timedelta(days=2)
     assert e == datetime(2025, 5, 3, tzinfo=tz)
 
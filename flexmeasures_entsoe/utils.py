@@ -1,13 +1,16 @@
 from typing import Dict, Optional, Tuple, Union
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from logging import Logger
+from zoneinfo import ZoneInfo
+import functools
+import sys
 
 from entsoe import EntsoePandasClient
 from flask import current_app
-from pandas.tseries.frequencies import to_offset
+import numpy as np
 import pandas as pd
 import click
-import pytz
 import entsoe
 
 from flexmeasures.data.utils import get_data_source, save_to_db
@@ -20,8 +23,44 @@ from . import (
     DEFAULT_DERIVED_DATA_SOURCE,
     DEFAULT_COUNTRY_CODE,
     DEFAULT_COUNTRY_TIMEZONE,
+    SensorSpec,
 )  # noqa: E402
 
+# How many beliefs to save to the database at a time
+_SAVE_CHUNK_SIZE = 500
+
+# Publication lead time of ENTSO-E data relative to the start of day D
+_SIX_HOURS = pd.Timedelta(hours=6)
+
+_ONE_DAY = timedelta(days=1)
+
+# Only style CLI error output when someone is actually watching a terminal
+_STDERR_IS_TTY = sys.stderr.isatty()
+
+# Default (start, end) day offsets from today for each default_to value
+_DEFAULT_DAY_OFFSETS = {
+    "today": (0, 1),
+    "tomorrow": (1, 2),
+    "today-and-tomorrow": (0, 2),
+}
+
+
+@dataclass(frozen=True)
+class EntsoeSettings:
+    """Plugin settings read from app config once, at app init."""
+
+    auth_token: Optional[str]
+    url: str
+    country_code: str
+    country_timezone: str
+    derived_data_source: str
+
+
+@functools.lru_cache(maxsize=32)
+def _tz(name: str) -> ZoneInfo:
+    """Look up a timezone, caching it so each zone is parsed only once per process."""
+    return ZoneInfo(name)
+
 
 def ensure_data_source() -> Source:
     return get_data_source(
@@ -32,9 +71,7 @@ def ensure_data_source() -> Source:
 
 def ensure_data_source_for_derived_data() -> Source:
     return get_data_source(
-        data_source_name=current_app.config.get(
-            "ENTSOE_DERIVED_DATA_SOURCE", DEFAULT_DERIVED_DATA_SOURCE
-        ),
+        data_source_name=get_entsoe_settings().derived_data_source,
         data_source_type="forecasting script",
     )
 
@@ -42,6 +79,9 @@ def ensure_data_source_for_derived_data() -> Source:
 def ensure_transmission_zone_asset(country_code: str) -> Asset:
     """
     Ensure a GenericAsset exists to model the transmission zone for which this plugin gathers data.
+
+    Does not commit; new objects are flushed by `ensure_sensors` (or on the next query,
+    via autoflush) and committed together with the rest of the import transaction.
     """
     transmission_zone_type = AssetType.query.filter(
         AssetType.name == "transmission zone"
@@ -63,12 +103,11 @@ def ensure_transmission_zone_asset(country_code: str) -> Asset:
             account_id=None,  # public
         )
         db.session.add(transmission_zone)
-    db.session.commit()
     return transmission_zone
 
 
 def ensure_sensors(
-    sensor_specifications: Tuple,
+    sensor_specifications: Tuple[SensorSpec, ...],
     country_code: str,
     timezone: str,
 ) -> Dict[str, Sensor]:
@@ -81,47 +120,80 @@ def ensure_sensors(
     sensors = {}
     sensors_created: bool = False
     transmission_zone = ensure_transmission_zone_asset(country_code)
-    for sensor_name, unit, event_resolution, data_by_entsoe in sensor_specifications:
-        sensor = Sensor.query.filter(
-            Sensor.name == sensor_name,
-            Sensor.unit == unit,
+    # Fetch all relevant sensors in one query, rather than one query per spec
+    existing_sensors = {
+        (s.name, s.unit): s
+        for s in Sensor.query.filter(
             Sensor.generic_asset == transmission_zone,
-        ).one_or_none()
+            Sensor.name.in_([spec.name for spec in sensor_specifications]),
+        ).all()
+    }
+    for spec in sensor_specifications:
+        sensor = existing_sensors.get((spec.name, spec.unit))
         if not sensor:
-            current_app.logger.info(f"Adding sensor {sensor_name} ...")
+            current_app.logger.info(f"Adding sensor {spec.name} ...")
             sensor = Sensor(
-                name=sensor_name,
-                unit=unit,
+                name=spec.name,
+                unit=spec.unit,
                 generic_asset=transmission_zone,
                 timezone=timezone,
-                event_resolution=event_resolution,
+                event_resolution=spec.event_resolution,
             )
             db.session.add(sensor)
             sensors_created = True
-        elif sensor.event_resolution != event_resolution:
+        elif sensor.event_resolution != spec.event_resolution:
             current_app.logger.warning(
-                f"The {sensor_name} sensor exists, but has a resolution of {sensor.event_resolution} instead of {event_resolution}. Please refer the 'October 1st 2025 go-live' instructions in `README.md`."
+                f"The {spec.name} sensor exists, but has a resolution of {sensor.event_resolution} instead of {spec.event_resolution}. Please refer the 'October 1st 2025 go-live' instructions in `README.md`."
             )
-        sensor.data_by_entsoe = data_by_entsoe
-        sensors[sensor_name] = sensor
+        sensor.data_by_entsoe = spec.data_by_entsoe
+        sensors[spec.name] = sensor
     if sensors_created:
         db.session.flush()
     return sensors
 
 
-def get_auth_token_from_config_and_set_server_url() -> str:
+def configure_entsoe(app):
     """
-    Read ENTSOE auth token from config, raise if not given.
+    Read the plugin's settings from app config once, at app init,
+    and select the ENTSO-E server URL and auth token.
     If test server is supposed to be used, we'll try to read the token
     usable for that, and also change the URL.
     """
-    use_test_server = current_app.config.get("ENTSOE_USE_TEST_SERVER", False)
+    use_test_server = app.config.get("ENTSOE_USE_TEST_SERVER", False)
     if use_test_server:
-        auth_token = current_app.config.get("ENTSOE_AUTH_TOKEN_TEST_SERVER")
-        entsoe.entsoe.URL = "https://iop-transparency.entsoe.eu/api"
+        auth_token = app.config.get("ENTSOE_AUTH_TOKEN_TEST_SERVER")
+        url = "https://iop-transparency.entsoe.eu/api"
     else:
-        auth_token = current_app.config.get("ENTSOE_AUTH_TOKEN")
-        entsoe.entsoe.URL = "https://web-api.tp.entsoe.eu/api"
+        auth_token = app.config.get("ENTSOE_AUTH_TOKEN")
+        url = "https://web-api.tp.entsoe.eu/api"
+    entsoe.entsoe.URL = url
+    app.extensions["entsoe"] = EntsoeSettings(
+        auth_token=auth_token,
+        url=url,
+        country_code=app.config.get("ENTSOE_COUNTRY_CODE", DEFAULT_COUNTRY_CODE),
+        country_timezone=app.config.get(
+            "ENTSOE_COUNTRY_TIMEZONE", DEFAULT_COUNTRY_TIMEZONE
+        ),
+        derived_data_source=app.config.get(
+            "ENTSOE_DERIVED_DATA_SOURCE", DEFAULT_DERIVED_DATA_SOURCE
+        ),
+    )
+
+
+def get_entsoe_settings() -> EntsoeSettings:
+    """
+    Return the plugin settings cached at app init (configuring lazily if needed).
+    """
+    if "entsoe" not in current_app.extensions:
+        configure_entsoe(current_app)
+    return current_app.extensions["entsoe"]
+
+
+def get_auth_token_from_config() -> str:
+    """
+    Read the ENTSOE auth token cached at app init, raise if not given.
+    """
+    auth_token = get_entsoe_settings().auth_token
     if not auth_token:
         click.echo("Setting ENTSOE_AUTH_TOKEN seems empty!")
         raise click.Abort
@@ -132,19 +204,16 @@ def ensure_country_code_and_timezone(
     country_code: Optional[str] = None,
     country_timezone: Optional[str] = None,
 ) -> Tuple[str, str]:
+    settings = get_entsoe_settings()
     if country_code is None:
-        country_code = current_app.config.get(
-            "ENTSOE_COUNTRY_CODE", DEFAULT_COUNTRY_CODE
-        )
+        country_code = settings.country_code
     if country_timezone is None:
-        country_timezone = current_app.config.get(
-            "ENTSOE_COUNTRY_TIMEZONE", DEFAULT_COUNTRY_TIMEZONE
-        )
+        country_timezone = settings.country_timezone
     return country_code, country_timezone
 
 
 def create_entsoe_client() -> EntsoePandasClient:
-    auth_token = get_auth_token_from_config_and_set_server_url()
+    auth_token = get_auth_token_from_config()
     client = EntsoePandasClient(api_key=auth_token)
     return client
 
@@ -163,12 +232,19 @@ def abort_if_data_incomplete(
     until_time: pd.Timestamp,
     resolution: pd.Timedelta,
 ):
-    expected_periods = int((until_time - from_time) / resolution)
-    if len(data) < expected_periods:
-        click.secho(
-            f"Result is incomplete. Expected {expected_periods} periods but got {len(data)}. Probably ENTSO-E does not provide these forecasts yet ...",
-            **MsgStyle.ERROR,
-        )
+    # Integer nanosecond arithmetic, to avoid allocating intermediate Timedeltas
+    resolution_ns = (
+        resolution.value
+        if isinstance(resolution, pd.Timedelta)
+        else pd.Timedelta(resolution).value
+    )
+    expected_periods = (until_time.value - from_time.value) // resolution_ns
+    if data.shape[0] < expected_periods:
+        msg = f"Result is incomplete. Expected {expected_periods} periods but got {data.shape[0]}. Probably ENTSO-E does not provide these forecasts yet ..."
+        if _STDERR_IS_TTY:
+            click.secho(msg, **MsgStyle.ERROR)
+        else:
+            click.echo(msg, err=True)
         raise click.Abort
 
 
@@ -183,33 +259,28 @@ def parse_from_and_to_dates(
     Note: we expect only dates as input here, and until_date is inclusive, so we extend it with 24h - so if from_date is equal to until_date, we return 00:00 and 24:00 of that day.
     Note:  entsoe-py expects time params as pd.Timestamp
     """
-    tz = pytz.timezone(country_timezone)
+    tz = _tz(country_timezone)
     now = datetime.now(tz)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-    if default_to == "today":
-        default_start = today_start
-        default_end = today_start + timedelta(days=1)
-    elif default_to == "tomorrow":
-        default_start = today_start + timedelta(days=1)
-        default_end = default_start + timedelta(days=1)
-    elif default_to == "today-and-tomorrow":
-        default_start = today_start
-        default_end = default_start + timedelta(days=2)
-    else:
+    try:
+        start_offset, end_offset = _DEFAULT_DAY_OFFSETS[default_to]
+    except KeyError:
         raise ValueError(
             f"Invalid default_to value: {default_to}. Expected 'today', 'tomorrow' or 'today-and-tomorrow'."
         )
+    default_start = today_start + start_offset * _ONE_DAY
+    default_end = today_start + end_offset * _ONE_DAY
 
     if from_date is None:
         start_date = pd.Timestamp(default_start)
     else:
-        start_date = pd.Timestamp(from_date, tzinfo=pytz.timezone(country_timezone))
+        start_date = pd.Timestamp(from_date, tzinfo=tz)
 
     if until_date is None:
         end_date = pd.Timestamp(default_end)
     else:
-        end_date = pd.Timestamp(until_date, tzinfo=pytz.timezone(country_timezone))
+        end_date = pd.Timestamp(until_date, tzinfo=tz)
         # The until_date provided is considered inclusive, so we add 24 hours to include the entire day
         end_date += pd.Timedelta(hours=24)
 
@@ -217,27 +288,48 @@ def parse_from_and_to_dates(
 
 
 def resample_if_needed(s: pd.Series, sensor: Sensor) -> pd.Series:
-    inferred_frequency = pd.infer_freq(s.index)
-    if inferred_frequency is None:
+    if len(s.index) < 2:
+        raise ValueError(
+            "Data has no discernible frequency from which to derive an event resolution."
+        )
+    # ENTSO-E series are regular, so the first diff is the resolution
+    # (pd.infer_freq would scan the whole index and parse frequency strings).
+    inferred_resolution = s.index[1] - s.index[0]
+    if current_app.debug and not (np.diff(s.index.asi8) == inferred_resolution.value).all():
         raise ValueError(
             "Data has no discernible frequency from which to derive an event resolution."
         )
-    inferred_resolution = pd.to_timedelta(to_offset(inferred_frequency))
     target_resolution = sensor.event_resolution
     if inferred_resolution == target_resolution:
         return s
     elif inferred_resolution > target_resolution:
         current_app.logger.debug(f"Upsampling data for {sensor.name} ...")
-        index = pd.date_range(
-            s.index[0],
-            s.index[-1] + inferred_resolution,
-            freq=target_resolution,
-            inclusive="left",
+        # Append one extra period past the last event, then let asfreq's
+        # datetime-native path do the forward fill (faster than a tz-aware reindex).
+        end = s.index[-1] + inferred_resolution
+        s = s.reindex(s.index.append(pd.DatetimeIndex([end]))).asfreq(
+            target_resolution, method="pad"
         )
-        s = s.reindex(index).pad()
+        # Keep the range left-inclusive: drop the appended endpoint, but only
+        # if it landed on the target grid (off-grid it is dropped by asfreq,
+        # and the last row is a genuine padded period)
+        if s.index[-1] == end:
+            s = s.iloc[:-1]
     elif inferred_resolution < target_resolution:
         current_app.logger.debug(f"Downsampling data for {sensor.name} ...")
-        s = s.resample(target_resolution).mean()
+        ratio = target_resolution // inferred_resolution
+        if ratio * inferred_resolution == target_resolution and len(s) % ratio == 0:
+            # Exact integer ratio on a regular grid: a reshape-then-mean
+            # skips the slow tz-aware resample dispatch entirely
+            s = pd.Series(
+                s.values.reshape(-1, ratio).mean(axis=1),
+                index=s.index[::ratio],
+                name=s.name,
+            )
+        else:
+            # Uneven ratio or incomplete data (e.g. DST days): tz-aware resample
+            # handles ambiguous and non-existent local times correctly
+            s = s.resample(target_resolution).mean()
     current_app.logger.debug(f"Resampled data for {sensor.name}: \n%s" % s)
     return s
 
@@ -253,26 +345,37 @@ def save_entsoe_series(
     Save a series gotten from ENTSO-E to a FlexMeasures database.
     """
     if not now:
-        now = server_now().astimezone(pytz.timezone(country_timezone))
+        now = server_now().astimezone(_tz(country_timezone))
+    # Published no later than D-1 18:00 Brussels time.
+    # normalize() truncates to local start of day directly on the int64 values
+    # (faster than floor("D") on a tz-aware index, and no DST ambiguity),
+    # and clipping to now is a plain np.minimum over those values.
+    bt_i8 = series.index.normalize().asi8 - _SIX_HOURS.value
+    now_i8 = pd.Timestamp(now).value
     belief_times = (
-        (series.index.floor("D") - pd.Timedelta("6h"))
-        .to_frame(name="clipped_belief_times")
-        .clip(upper=now)
-        .set_index("clipped_belief_times")
-        .index
-    )  # published no later than D-1 18:00 Brussels time
-    bdf = BeliefsDataFrame(
-        series,
-        source=entsoe_source,
-        sensor=sensor,
-        belief_time=belief_times,
+        pd.DatetimeIndex(np.minimum(bt_i8, now_i8))
+        .tz_localize("UTC")
+        .tz_convert(series.index.tz)
     )
 
     # TODO: evaluate some traits of the data via FlexMeasures, see https://github.com/SeitaBV/flexmeasures-entsoe/issues/3
-    status = save_to_db(bdf)
-    if status == "success_but_nothing_new":
+    # Save in chunks, so multi-year imports don't materialize one giant
+    # BeliefsDataFrame in memory and the DB sees progress along the way.
+    statuses = []
+    for chunk_start in range(0, len(series), _SAVE_CHUNK_SIZE):
+        bdf = BeliefsDataFrame(
+            series.iloc[chunk_start : chunk_start + _SAVE_CHUNK_SIZE],
+            source=entsoe_source,
+            sensor=sensor,
+            belief_time=belief_times[chunk_start : chunk_start + _SAVE_CHUNK_SIZE],
+        )
+        statuses.append(save_to_db(bdf))
+    if statuses and all(status == "success_but_nothing_new" for status in statuses):
         current_app.logger.info("Done. These beliefs had already been saved before.")
-    elif status == "success_with_unchanged_beliefs_skipped":
+    elif any(
+        status in ("success_but_nothing_new", "success_with_unchanged_beliefs_skipped")
+        for status in statuses
+    ):
         current_app.logger.info("Done. Some beliefs had already been saved before.")
 
 
@@ -287,5 +390,5 @@ def start_import_log(
     log.info(
         f"Importing {import_type} data for {country_code} (timezone {country_timezone}), starting at {from_time}, up until {until_time}, from ENTSO-E at {entsoe.entsoe.URL} ..."
     )
-    now = server_now().astimezone(pytz.timezone(country_timezone))
+    now = server_now().astimezone(_tz(country_timezone))
     return log, now